@@ -277,8 +277,8 @@ class SecurityIssuesChartData(ChartData):
 
         for file_metric in metrics.file_metrics:
             for issue in file_metric.security_issues:
-                level = issue.get('level', SecurityLevel.MEDIUM_RISK)
-                severity = issue.get('severity', 'medium').lower()
+                level = issue.level
+                severity = issue.severity.lower()
 
                 if level == SecurityLevel.CRITICAL or severity == 'critical':
                     security_counts["Critical"] += 1
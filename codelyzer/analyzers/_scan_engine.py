@@ -0,0 +1,230 @@
+"""
+Multi-pattern scan engine used by the security analyzer.
+Uses Hyperscan or Aho-Corasick as a prefilter when installed and the standard re module otherwise.
+"""
+import re
+from typing import Dict, FrozenSet, Iterator, List, Optional, Sequence, Tuple, Union
+
+try:
+    import hyperscan
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    hyperscan = None
+    HYPERSCAN_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    ahocorasick = None
+    AHOCORASICK_AVAILABLE = False
+
+# (group name, pattern, ignore case)
+ScanRule = Tuple[str, str, bool]
+
+# Counted repetition with an upper bound, e.g. the {0,512} in [^)]{0,512}
+_BOUNDED_REPEAT = re.compile(r"\{(\d+),\d+\}")
+
+
+def compile_rules(rules: Sequence[ScanRule], as_bytes: bool = False) -> re.Pattern:
+    """Fuse rules into one named-group alternation so a file is scanned in a single pass.
+
+    The rule that matched is dispatched on ``match.lastgroup``. This is the same single-pass
+    lexer idea as ``re.Scanner``, which is not used because it stops at the first position no
+    rule matches: skipping ordinary code would take a catch-all rule and a Python-level step
+    per character, which is about twice as slow as ``finditer`` and defeats the prefilters.
+    """
+    source = "|".join(
+        f"(?P<{name}>(?i:{pattern}))" if ignore_case else f"(?P<{name}>{pattern})"
+        for name, pattern, ignore_case in rules
+    )
+    return re.compile(source.encode("ascii") if as_bytes else source)
+
+
+def unbounded(pattern: str) -> str:
+    """Drop the upper bound of every counted repetition in the pattern.
+
+    The bounds only keep re from backtracking over long lines. Hyperscan does not backtrack,
+    and it compiles wide bounded repeats very slowly (seconds per rule), so the prefilter
+    database gets the unbounded form. Its matches are a superset, which prefilter mode allows.
+    """
+    return _BOUNDED_REPEAT.sub(r"{\1,}", pattern)
+
+
+def literal_prefix(pattern: str) -> str:
+    """Return the literal text every match of the pattern starts with (possibly empty)"""
+    if "|" in pattern:
+        return ""
+
+    prefix = []
+    i = 0
+    while i < len(pattern):
+        if pattern[i] == "\\" and i + 1 < len(pattern) and not pattern[i + 1].isalnum():
+            literal, i = pattern[i + 1], i + 2
+        elif pattern[i].isalnum() or pattern[i] == "_":
+            literal, i = pattern[i], i + 1
+        else:
+            break
+        # An optional character is not part of every match
+        if i < len(pattern) and pattern[i] in "?*{":
+            break
+        prefix.append(literal)
+        if i < len(pattern) and pattern[i] == "+":
+            break
+    return "".join(prefix)
+
+
+class RuleScanner:
+    """Scans text for a fixed set of named rules.
+
+    ASCII content is scanned as bytes: offsets are the same as in the str, and bytes patterns
+    skip the Unicode case folding of ``(?i)`` rules. Other content is scanned as str.
+
+    Matches are always produced by re, so results are identical whichever prefilter is used:
+
+    - Hyperscan: all rules are compiled into a single prefilter database. One pass over
+      the file tells which rules can possibly match; files without any candidate skip the
+      regex engine and the rest are scanned with an alternation of only the rules that hit.
+    - Aho-Corasick: every rule starts with a literal anchor (``os.system(``, ``password``...).
+      The automaton finds all anchor offsets in one pass and the fused pattern is only
+      tried at those offsets.
+
+    The prefilters are built on the first scan, so creating a scanner (and importing the
+    analyzers) stays cheap.
+    """
+
+    def __init__(self, rules: Sequence[ScanRule]) -> None:
+        self.rules = tuple(rules)
+        self.pattern = compile_rules(self.rules)
+        self.bytes_pattern = compile_rules(self.rules, as_bytes=True)
+        self._subset_patterns: Dict[Tuple[FrozenSet[int], bool], re.Pattern] = {}
+        self._prefilters_built = False
+        self._database = None
+        self._automaton = None
+        # Anchors of case-insensitive rules are matched against lowercased content
+        self._fold_case = any(ignore_case for _, _, ignore_case in self.rules)
+
+    def finditer(self, content: str) -> Iterator[re.Match]:
+        """Iterate over non-overlapping rule matches in the content.
+
+        Match offsets always refer to the content, but matches of ASCII content are bytes matches.
+        """
+        if not self._prefilters_built:
+            self._build_prefilters()
+
+        is_ascii = content.isascii()
+        if is_ascii:
+            data, pattern = content.encode("ascii"), self.bytes_pattern
+        else:
+            data, pattern = content, self.pattern
+
+        if self._database is not None:
+            hits = self._prefilter(data)
+            if hits is None:
+                return pattern.finditer(data)
+            if not hits:
+                return iter(())
+            return self._pattern_for(frozenset(hits), is_ascii).finditer(data)
+
+        if self._automaton is not None:
+            starts = self._anchor_offsets(content)
+            if starts is None:
+                return pattern.finditer(data)
+            return self._match_at(data, pattern, starts)
+
+        return pattern.finditer(data)
+
+    def _build_prefilters(self) -> None:
+        """Build the Hyperscan database, or the Aho-Corasick automaton if Hyperscan is unavailable"""
+        if HYPERSCAN_AVAILABLE:
+            self._database = self._build_database(self.rules)
+        if self._database is None and AHOCORASICK_AVAILABLE:
+            self._automaton = self._build_automaton(self.rules, self._fold_case)
+        self._prefilters_built = True
+
+    @staticmethod
+    def _build_database(rules: Sequence[ScanRule]) -> Optional["hyperscan.Database"]:
+        """Compile the rules into a Hyperscan block-mode database"""
+        # Prefilter mode accepts constructs Hyperscan cannot execute exactly (e.g. lookahead)
+        # and reports a superset of the real matches, which re then confirms.
+        base_flags = (hyperscan.HS_FLAG_PREFILTER | hyperscan.HS_FLAG_SINGLEMATCH |
+                      hyperscan.HS_FLAG_UTF8 | hyperscan.HS_FLAG_UCP)
+        database = hyperscan.Database()
+        try:
+            database.compile(
+                expressions=[unbounded(pattern).encode("utf-8") for _, pattern, _ in rules],
+                ids=list(range(len(rules))),
+                elements=len(rules),
+                flags=[base_flags | hyperscan.HS_FLAG_CASELESS if ignore_case else base_flags
+                       for _, _, ignore_case in rules],
+            )
+        except hyperscan.error:
+            return None
+        return database
+
+    @staticmethod
+    def _build_automaton(rules: Sequence[ScanRule], fold_case: bool) -> Optional["ahocorasick.Automaton"]:
+        """Build an Aho-Corasick automaton over the literal anchor of every rule"""
+        automaton = ahocorasick.Automaton()
+        for _, pattern, _ in rules:
+            anchor = literal_prefix(pattern)
+            # Anchors must be folded exactly when the content they are searched in is
+            if fold_case:
+                anchor = anchor.lower()
+            if not anchor:
+                # A rule without an anchor could match anywhere
+                return None
+            automaton.add_word(anchor, len(anchor))
+        automaton.make_automaton()
+        return automaton
+
+    def _prefilter(self, data: Union[str, bytes]) -> Optional[List[int]]:
+        """Return the ids of rules that may match, or None if the content cannot be prefiltered"""
+        if isinstance(data, str):
+            try:
+                data = data.encode("utf-8")
+            except UnicodeEncodeError:
+                return None
+
+        hits: List[int] = []
+
+        def on_match(rule_id: int, start: int, end: int, flags: int, context: object) -> None:
+            hits.append(rule_id)
+
+        self._database.scan(data, match_event_handler=on_match)
+        return hits
+
+    def _anchor_offsets(self, content: str) -> Optional[List[int]]:
+        """Return the sorted offsets of all anchors, or None if the content cannot be prefiltered"""
+        if self._fold_case:
+            # Lowercasing non-ASCII text can change its length and shift the offsets
+            if not content.isascii():
+                return None
+            haystack = content.lower()
+        else:
+            haystack = content
+        return sorted({end - length + 1 for end, length in self._automaton.iter(haystack)})
+
+    @staticmethod
+    def _match_at(data: Union[str, bytes], pattern: re.Pattern, starts: List[int]) -> Iterator[re.Match]:
+        """Try the fused pattern at each candidate offset, mirroring finditer's non-overlapping scan"""
+        match_at = pattern.match
+        position = 0
+        for start in starts:
+            if start < position:
+                continue
+            match = match_at(data, start)
+            if match:
+                yield match
+                position = match.end()
+
+    def _pattern_for(self, rule_ids: FrozenSet[int], as_bytes: bool) -> re.Pattern:
+        """Get the fused pattern for a subset of the rules"""
+        if len(rule_ids) == len(self.rules):
+            return self.bytes_pattern if as_bytes else self.pattern
+        key = (rule_ids, as_bytes)
+        pattern = self._subset_patterns.get(key)
+        if pattern is None:
+            pattern = compile_rules([rule for i, rule in enumerate(self.rules) if i in rule_ids], as_bytes)
+            self._subset_patterns[key] = pattern
+        return pattern
@@ -71,7 +71,7 @@ class ComplexityAnalyzer(MetricProvider):
             key=lambda f: f.complexity_score,
             reverse=True
         )
-        project_metrics.complexity.most_complex_files = [f.file_path for f in sorted_by_complexity[:10]]
+        project_metrics.complexity.set_most_complex(sorted_by_complexity[:10])
 
     @staticmethod
     def _calculate_cyclomatic_complexity(content: str, language: str) -> int:
@@ -11,7 +11,7 @@ from codelyzer.config import LANGUAGE_CONFIGS
 from codelyzer.console import (
     console, create_summary_panel, display_initial_info, display_final_summary,
     display_verbose_info, create_and_display_layout, logger, debug, debug_log,
-    set_log_level
+    set_log_level, init_console
 )
 from codelyzer.core import AdvancedCodeAnalyzer, ReportExport
 
@@ -81,6 +81,8 @@ def analyze(
     """
     🚀 Analyze your codebase with advanced metrics and beautiful reports
     """
+    init_console()
+
     # Set log level based on verbose/debug flags
     if debug_mode:
         set_log_level(logging.DEBUG)
@@ -148,6 +150,8 @@ def compare(
     """
     ⚖️ Compare two codebases side by side
     """
+    init_console()
+
     # Set log level if debug mode is enabled
     if debug_mode:
         set_log_level(logging.DEBUG)
@@ -221,6 +225,8 @@ def languages():
     """
     🌐 Show supported programming languages
     """
+    init_console()
+
     logger.info("Displaying supported languages information")
     
     console.print(Panel.fit(
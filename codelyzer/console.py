@@ -2,32 +2,35 @@
 Console and display utilities for CodeLyzer.
 Centralizes all console output, logging, progress bars, and rich display components.
 """
+import atexit
 import functools
 import logging
 import os
+import queue
 import sys
-from datetime import datetime
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, List, Dict, Callable, TypeVar, cast
+from typing import Any, List, Callable, NamedTuple, Optional, Tuple, TypeVar, cast
 
+import numpy as np
 from rich import box
-from rich.console import Console
+from rich.console import Console, Group
 from rich.layout import Layout
 from rich.logging import RichHandler
 from rich.markdown import Markdown
 from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeElapsedColumn, TimeRemainingColumn
+from rich.rule import Rule
 from rich.table import Table
-from rich.box import Box
-from rich.traceback import install as install_rich_traceback
 
 from codelyzer.metrics import ProjectMetrics, ComplexityLevel
-from codelyzer.config import LOG_FILENAME, DEBUG, LOG_FILENAME
-
-# Install rich traceback handler for better exception visualization
-install_rich_traceback()
-
+from codelyzer.config import LOG_FILENAME as _RAW_LOG_FILENAME, DEBUG
 
+# Absolute log file path, resolved once so it stays valid and unambiguous wherever it is reported
+LOG_FILENAME: Path = Path(_RAW_LOG_FILENAME).resolve()
 
 # Configure the rich console for standard output
 console = Console()
@@ -42,21 +45,95 @@ rich_handler = RichHandler(
     show_path=True
 )
 
-# Configure file handler for log file output
-file_handler = logging.FileHandler(LOG_FILENAME, mode="w", encoding="utf-8")
-file_handler.setFormatter(
-    logging.Formatter(
-        "[%(asctime)s] [%(levelname)s] [%(module)s:%(lineno)d] %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S"
+class BufferedFileHandler(logging.FileHandler):
+    """File handler that coalesces records into batched writes.
+
+    Records are written once ``capacity`` of them are buffered, when a record at ERROR or above
+    arrives, or ``flush_interval`` seconds after the first buffered record, whichever comes first.
+    """
+
+    def __init__(self, filename: Any, mode: str = "a", encoding: Optional[str] = None, delay: bool = False,
+                 capacity: int = 512, flush_interval: float = 0.25) -> None:
+        super().__init__(filename, mode, encoding, delay)
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+        self._buffer: List[str] = []
+        self._timer: Optional[threading.Timer] = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self._buffer.append(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+            return
+
+        if len(self._buffer) >= self.capacity or record.levelno >= logging.ERROR:
+            self.flush()
+        elif self._timer is None:
+            self._timer = threading.Timer(self.flush_interval, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self) -> None:
+        with self.lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._buffer:
+                if self.stream is None:
+                    self.stream = self._open()
+                self.stream.write("".join(self._buffer))
+                self._buffer.clear()
+            super().flush()
+
+    def close(self) -> None:
+        self.flush()
+        super().close()
+
+
+# File handler and queue listener, created by init_console()
+file_handler: Optional[BufferedFileHandler] = None
+queue_listener: Optional[QueueListener] = None
+
+
+def init_console() -> None:
+    """Install the rich traceback hook and start the log handlers.
+
+    Called by the CLI once its arguments are parsed, so importing codelyzer neither replaces
+    sys.excepthook nor configures the root logger or opens the log file. Calling it again is a no-op.
+    """
+    global file_handler, queue_listener
+    if queue_listener is not None:
+        return
+
+    # Install rich traceback handler for better exception visualization
+    from rich.traceback import install as install_rich_traceback
+    install_rich_traceback()
+
+    # Configure file handler for log file output
+    file_handler = BufferedFileHandler(LOG_FILENAME, mode="w", encoding="utf-8")
+    file_handler.setFormatter(
+        logging.Formatter(
+            "[%(asctime)s] [%(levelname)s] [%(module)s:%(lineno)d] %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S"
+        )
     )
-)
 
-# Configure root logger
-logging.basicConfig(
-    level=logging.INFO,
-    handlers=[rich_handler, file_handler],
-    format="%(message)s",  # The rich handler will handle the formatting for console
-)
+    # Log file writes happen on a background thread. The rich handler stays synchronous so log
+    # lines keep their place among the console.print() output they are interleaved with.
+    # QueueHandler.prepare() still formats each record on the calling thread before queueing it,
+    # so %-style arguments only save work for records the logger level filters out.
+    log_queue = queue.SimpleQueue()
+    queue_listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+    queue_listener.start()
+    atexit.register(queue_listener.stop)
+
+    # Configure root logger
+    logging.basicConfig(
+        level=logging.INFO,
+        handlers=[rich_handler, QueueHandler(log_queue)],
+        format="%(message)s",  # The rich handler will handle the formatting for console
+    )
 
 # Create dedicated logger for CodeLyzer
 logger = logging.getLogger("codelyzer")
@@ -81,32 +158,38 @@ def debug(func: F) -> F:
         func: The function to decorate
         
     Returns:
-        The decorated function
+        The decorated function, or the function itself when DEBUG is off
     """
+    # DEBUG is fixed at import time, so skip the wrapper entirely instead of checking it per call
+    return _make_debug_wrapper(func) if DEBUG else func
+
+def _make_debug_wrapper(func: F) -> F:
+    """Wrap a function to log its entry, exit, and execution time."""
     @functools.wraps(func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
-        if not DEBUG:
+        # The level can still be raised at runtime (set_log_level), so skip all the formatting then
+        if not logger.isEnabledFor(logging.DEBUG):
             return func(*args, **kwargs)
-        
+
         # Log function entry with arguments
-        arg_str = ", ".join([str(a) for a in args])
-        kwarg_str = ", ".join([f"{k}={v}" for k, v in kwargs.items()])
+        arg_str = ", ".join(map(repr, args))
+        kwarg_str = ", ".join(f"{k}={v!r}" for k, v in kwargs.items())
         params = ", ".join(filter(None, [arg_str, kwarg_str]))
-        logger.debug(f"ENTER: {func.__name__}({params})")
+        logger.debug("ENTER: %s(%s)", func.__name__, params)
         
         # Track execution time
-        start_time = datetime.now()
+        start_time = time.perf_counter_ns()
         
         try:
             result = func(*args, **kwargs)
-            logger.debug(f"EXIT: {func.__name__} -> {result if result is not None else 'None'}")
+            logger.debug("EXIT: %s -> %s", func.__name__, result)
             return result
         except Exception as e:
-            logger.debug(f"ERROR in {func.__name__}: {str(e)}")
+            logger.debug("ERROR in %s: %s", func.__name__, e)
             raise
         finally:
-            execution_time = (datetime.now() - start_time).total_seconds()
-            logger.debug(f"TIME: {func.__name__} took {execution_time:.4f}s")
+            elapsed_us = (time.perf_counter_ns() - start_time) / 1000.0
+            logger.debug("TIME: %s took %.3fµs", func.__name__, elapsed_us)
     
     return cast(F, wrapper)
 
@@ -117,7 +200,7 @@ def set_log_level(level: int) -> None:
         level: The log level to set (e.g., logging.DEBUG, logging.INFO)
     """
     logger.setLevel(level)
-    logger.info(f"Log level set to {logging.getLevelName(level)}")
+    logger.info("Log level set to %s", logging.getLevelName(level))
 
 def get_log_file_path() -> Path:
     """Get the current log file path.
@@ -127,31 +210,31 @@ def get_log_file_path() -> Path:
     """
     return LOG_FILENAME
 
+class _SummaryStats(NamedTuple):
+    """Values shown in the summary panel, used as its cache key"""
+    total_files: int
+    total_loc: int
+    total_sloc: int
+    total_comments: int
+    total_blanks: int
+    total_classes: int
+    total_functions: int
+    total_methods: int
+    code_quality_score: float
+    maintainability_score: float
+    analysis_duration: float
+
 @debug
 def create_summary_panel(metrics: ProjectMetrics) -> Panel:
     """Create a summary panel with project metrics."""
-    summary_text = f"""
-📊 **Project Overview**
-• Files analyzed: {metrics.total_files:,}
-• Lines of code: {metrics.total_loc:,}
-• Source lines: {metrics.total_sloc:,}
-• Comments: {metrics.total_comments:,}
-• Blank lines: {metrics.total_blanks:,}
-
-🏗️ **Code Structure**
-• Classes: {metrics.total_classes:,}
-• Functions: {metrics.total_functions:,}
-• Methods: {metrics.total_methods:,}
-
-📈 **Quality Metrics**
-• Code quality: {metrics.code_quality_score:.1f}/100
-• Maintainability: {metrics.maintainability_score:.1f}/100
-• Analysis time: {metrics.analysis_duration:.2f}s
-"""
-
-    logger.info(f"Created summary panel with {metrics.total_files} files and {metrics.total_loc} lines")
+    stats = _SummaryStats(
+        metrics.total_files, metrics.total_loc, metrics.total_sloc, metrics.total_comments,
+        metrics.total_blanks, metrics.total_classes, metrics.total_functions, metrics.total_methods,
+        metrics.code_quality_score, metrics.maintainability_score, metrics.analysis_duration
+    )
+    logger.info("Created summary panel with %d files and %d lines", metrics.total_files, metrics.total_loc)
     return Panel(
-        Markdown(summary_text),
+        _build_summary_markdown(stats),
         title="📋 Analysis Summary",
         border_style="blue",
         padding=(1, 2),
@@ -159,6 +242,32 @@ def create_summary_panel(metrics: ProjectMetrics) -> Panel:
         highlight=True
     )
 
+@functools.lru_cache(maxsize=4)
+def _build_summary_markdown(stats: _SummaryStats) -> Markdown:
+    """Build the summary Markdown, parsing it only once per distinct set of values.
+
+    The result is shared between calls and must not be modified.
+    """
+    summary_text = f"""
+📊 **Project Overview**
+• Files analyzed: {stats.total_files:,}
+• Lines of code: {stats.total_loc:,}
+• Source lines: {stats.total_sloc:,}
+• Comments: {stats.total_comments:,}
+• Blank lines: {stats.total_blanks:,}
+
+🏗️ **Code Structure**
+• Classes: {stats.total_classes:,}
+• Functions: {stats.total_functions:,}
+• Methods: {stats.total_methods:,}
+
+📈 **Quality Metrics**
+• Code quality: {stats.code_quality_score:.1f}/100
+• Maintainability: {stats.maintainability_score:.1f}/100
+• Analysis time: {stats.analysis_duration:.2f}s
+"""
+    return Markdown(summary_text)
+
 @debug
 def create_language_distribution_table(metrics: ProjectMetrics) -> Table:
     """Create a table showing language distribution."""
@@ -167,24 +276,37 @@ def create_language_distribution_table(metrics: ProjectMetrics) -> Table:
         box=box.ROUNDED,
         title_style="bold blue",
         border_style="cyan",
-        highlight=True
+        highlight=False
     )
     table.add_column("Language", style="cyan", no_wrap=True)
     table.add_column("Files", justify="right", style="magenta")
     table.add_column("Percentage", justify="right", style="green")
 
-    total_files = sum(metrics.languages.values())
-    for language, count in sorted(metrics.languages.items(), key=lambda x: x[1], reverse=True):
-        percentage = (count / total_files) * 100 if total_files > 0 else 0
-        table.add_row(
-            language.title(),
-            str(count),
-            f"{percentage:.1f}%"
-        )
-    
-    logger.info(f"Created language distribution table with {len(metrics.languages)} languages")
+    rows = _language_distribution_rows(tuple(metrics.languages.items()), metrics.total_files_by_language)
+    for row in rows:
+        table.add_row(*row)
+
+    logger.info("Created language distribution table with %d languages", len(metrics.languages))
     return table
 
+@functools.lru_cache(maxsize=4)
+def _language_distribution_rows(languages: Tuple[Tuple[str, int], ...],
+                                total_files: int) -> Tuple[Tuple[str, str, str], ...]:
+    """Format the language distribution rows for (language, file count) pairs."""
+    scale = 100.0 / total_files if total_files else 0.0
+    return tuple(
+        (language.title(), str(count), f"{count * scale:.1f}%")
+        for language, count in sorted(languages, key=itemgetter(1), reverse=True)
+    )
+
+# Row color per complexity level; anything above moderate is red
+_COMPLEXITY_STYLE = {
+    ComplexityLevel.TRIVIAL: "green",
+    ComplexityLevel.LOW: "green",
+    ComplexityLevel.MODERATE: "yellow",
+}
+_DEFAULT_COMPLEXITY_STYLE = "red"
+
 @debug
 def create_complexity_table(metrics: ProjectMetrics) -> Table:
     """Create a table showing code complexity distribution."""
@@ -193,56 +315,44 @@ def create_complexity_table(metrics: ProjectMetrics) -> Table:
         box=box.ROUNDED,
         title_style="bold blue",
         border_style="cyan",
-        highlight=True
+        highlight=False
     )
     table.add_column("Complexity Level", style="cyan")
     table.add_column("Files", justify="right", style="magenta")
     table.add_column("Percentage", justify="right", style="green")
 
-    total_files = sum(metrics.complexity_distribution.values())
+    # noinspection PyTypeChecker
+    counts = tuple(metrics.complexity_distribution.get(level, 0) for level in ComplexityLevel)
+    for row in _complexity_rows(counts, metrics.total_files_by_complexity):
+        table.add_row(*row)
+
+    logger.info("Created complexity table with distribution across %d levels", len(ComplexityLevel))
+    return table
+
+@functools.lru_cache(maxsize=4)
+def _complexity_rows(counts: Tuple[int, ...], total_files: int) -> Tuple[Tuple[str, str, str], ...]:
+    """Format the complexity distribution rows for the file count of each ComplexityLevel."""
+    scale = 100.0 / total_files if total_files else 0.0
 
-    for level in ComplexityLevel:
-        # noinspection PyTypeChecker
-        count = metrics.complexity_distribution.get(level, 0)
-        percentage = (count / total_files) * 100 if total_files > 0 else 0
+    rows = []
+    for level, count in zip(ComplexityLevel, counts):
+        percentage = count * scale
 
         # Color coding
-        if level in [ComplexityLevel.TRIVIAL, ComplexityLevel.LOW]:
-            style = "green"
-        elif level == ComplexityLevel.MODERATE:
-            style = "yellow"
-        else:
-            style = "red"
+        style = _COMPLEXITY_STYLE.get(level, _DEFAULT_COMPLEXITY_STYLE)
 
-        table.add_row(
+        rows.append((
             level.replace('_', ' ').title(),
             f"[{style}]{count}[/{style}]",
             f"[{style}]{percentage:.1f}%[/{style}]"
-        )
-    
-    logger.info(f"Created complexity table with distribution across {len(ComplexityLevel)} levels")
-    return table
+        ))
 
-@debug
-def create_table(title: str, box: Box, title_style: str, border_style: str, highlight: bool) -> Table:
-    """Create a table with the given parameters."""
-    logger.debug(f"Creating table with title: {title}")
-    return Table(
-        title=title,
-        box=box,
-        title_style=title_style,
-        border_style=border_style,
-        highlight=highlight
-    )
+    return tuple(rows)
 
-@debug
-def create_table_columns(table: Table, columns: Dict[str, Dict[str, Any]]) -> Table:
-    """Update a table with the given columns."""
-    logger.debug(f"Adding {len(columns)} columns to table")
-    for column_name, column_config in columns.items():
-        table.add_column(column_name, **column_config)
-    return table
+# Working directory prefix, so paths under it are made relative without building Path objects
+_CWD_STR = str(Path.cwd()) + os.sep
 
+@functools.lru_cache(maxsize=4096)
 def _get_file_relative_path(file_path: str) -> str:
     """Get a readable relative path for display.
     
@@ -252,6 +362,9 @@ def _get_file_relative_path(file_path: str) -> str:
     Returns:
         A simplified relative path for display
     """
+    if file_path.startswith(_CWD_STR):
+        return file_path[len(_CWD_STR):]
+
     try:
         # Try relative path first
         relative_path = str(Path(file_path).relative_to(Path.cwd()))
@@ -264,100 +377,55 @@ def _get_file_relative_path(file_path: str) -> str:
         else:
             relative_path = path_obj.name
     
-    debug_log(f"Resolved file path '{file_path}' to relative path '{relative_path}'")
+    logger.debug("Resolved file path '%s' to relative path '%s'", file_path, relative_path)
     return relative_path
 
-def _get_issue_style(issue_count: int) -> str:
-    """Determine the style color based on issue count.
-    
-    Args:
-        issue_count: Number of issues in the file
-        
-    Returns:
-        Style color name
-    """
-    if issue_count == 0:
-        return "green"
-    elif issue_count < 3:
-        return "yellow"
-    else:
-        return "red"
-
-def _get_issue_display(issue_count: int, style: str) -> str:
-    """Format the issue display with appropriate styling.
+# Issue cells: clean files share one constant, otherwise the count is yellow below 3 and red above
+_OK_CELL = "[green]✅[/green]"
+_YELLOW_TEMPLATE = "[yellow]{}[/yellow]"
+_RED_TEMPLATE = "[red]{}[/red]"
+
+def _get_issue_display(issue_count: int) -> str:
+    """Format the issue count with styling based on how many issues there are.
     
     Args:
         issue_count: Number of issues in the file
-        style: Style color to use
         
     Returns:
         Formatted issue string
     """
-    display_text = "✅" if issue_count == 0 else str(issue_count)
-    return f"[{style}]{display_text}[/{style}]"
-
-def _create_hotspots_table_columns() -> Dict[str, Dict[str, Any]]:
-    """Define the columns for the hotspots table.
-    
-    Returns:
-        Dictionary of column configurations
-    """
-    return {
-        "file": {"style": "cyan", "max_width": 50},
-        "lines": {"justify": "right", "style": "magenta"},
-        "complexity": {"justify": "right", "style": "red"},
-        "issues": {"justify": "right", "style": "yellow"}
-    }
-
-def _build_file_metrics_map(metrics: ProjectMetrics) -> Dict[str, Any]:
-    """Create a mapping of file paths to their metrics for quick lookup.
-    
-    Args:
-        metrics: Project metrics data
-        
-    Returns:
-        Dictionary mapping file paths to FileMetrics objects
-    """
-    file_map = {fm.file_path: fm for fm in metrics.file_metrics}
-    debug_log(f"Built file metrics map with {len(file_map)} entries")
-    return file_map
+    if issue_count == 0:
+        return _OK_CELL
+    return (_YELLOW_TEMPLATE if issue_count < 3 else _RED_TEMPLATE).format(issue_count)
 
 @debug
 def create_hotspots_table(metrics: ProjectMetrics) -> Table:
     """Create a table showing code hotspots (most complex files)."""
-    table = create_table(
+    table = Table(
         title="🔥 Code Hotspots (Most Complex Files)",
         box=box.ROUNDED,
         title_style="bold blue",
         border_style="cyan",
-        highlight=True
+        highlight=False
     )
-    
-    columns = _create_hotspots_table_columns()
-    create_table_columns(table, columns)
+    table.add_column("file", style="cyan", max_width=50)
+    table.add_column("lines", justify="right", style="magenta")
+    table.add_column("complexity", justify="right", style="red")
+    table.add_column("issues", justify="right", style="yellow")
 
-    # Create a mapping of file paths to file metrics for quick lookup
-    file_metrics_map = _build_file_metrics_map(metrics)
-
-    # Loop through the most complex file paths and find their corresponding FileMetrics objects
-    hotspot_count = min(10, len(metrics.most_complex_files))
-    logger.info(f"Adding {hotspot_count} files to hotspots table")
+    hotspots = metrics.most_complex_file_metrics[:10]
+    logger.info("Adding %d files to hotspots table", len(hotspots))
     
-    for file_path in metrics.most_complex_files[:10]:
-        # Get the FileMetrics object for this file path
-        file_metrics = file_metrics_map.get(file_path)
-
-        if file_metrics:
-            relative_path = _get_file_relative_path(file_metrics.file_path)
-            issues = len(file_metrics.security_issues) + len(file_metrics.code_smells_list)
-            issue_style = _get_issue_style(issues)
-
-            table.add_row(
-                relative_path,
-                str(file_metrics.sloc),
-                f"{file_metrics.complexity_score:.0f}",
-                _get_issue_display(issues, issue_style)
-            )
+    for file_metrics in hotspots:
+        relative_path = _get_file_relative_path(file_metrics.file_path)
+        issues = len(file_metrics.security_issues) + len(file_metrics.code_smells_list)
+
+        table.add_row(
+            relative_path,
+            str(file_metrics.sloc),
+            f"{file_metrics.complexity_score:.0f}",
+            _get_issue_display(issues)
+        )
 
     return table
 
@@ -369,14 +437,14 @@ def create_dependencies_table(metrics: ProjectMetrics) -> Table:
         box=box.ROUNDED,
         title_style="bold blue",
         border_style="cyan",
-        highlight=True
+        highlight=False
     )
     table.add_column("Module", style="cyan")
     table.add_column("Usage Count", justify="right", style="magenta")
 
     # Get top 15 dependencies
-    top_deps = sorted(metrics.structure.dependencies.items(), key=lambda x: x[1], reverse=True)[:15]
-    logger.info(f"Adding {len(top_deps)} dependencies to table")
+    top_deps = sorted(metrics.structure.dependencies.items(), key=itemgetter(1), reverse=True)[:15]
+    logger.info("Adding %d dependencies to table", len(top_deps))
 
     for module, count in top_deps:
         table.add_row(module, str(count))
@@ -411,92 +479,108 @@ def create_analysis_progress_bar() -> Progress:
         console=console
     )
 
+# Report layout, split once and reused by later calls with fresh tables in its panes
+_report_layout: Optional[Layout] = None
+
+def _get_report_layout() -> Layout:
+    """Get the report layout, building its panes on first use."""
+    global _report_layout
+    if _report_layout is None:
+        layout = Layout()
+        layout.split_column(
+            Layout(name="top"),
+            Layout(name="bottom")
+        )
+        layout["top"].split_row(
+            Layout(name="languages"),
+            Layout(name="complexity")
+        )
+        layout["bottom"].split_row(
+            Layout(name="hotspots"),
+            Layout(name="dependencies")
+        )
+        _report_layout = layout
+    return _report_layout
+
 @debug
 def create_and_display_layout(metrics: ProjectMetrics) -> None:
     """Create and display the layout with all metric tables."""
     logger.info("Creating and displaying layout with metric tables")
-    layout = Layout()
-    layout.split_column(
-        Layout(name="top"),
-        Layout(name="bottom")
-    )
-
-    layout["top"].split_row(
-        Layout(create_language_distribution_table(metrics), name="languages"),
-        Layout(create_complexity_table(metrics), name="complexity")
-    )
-
-    layout["bottom"].split_row(
-        Layout(create_hotspots_table(metrics), name="hotspots"),
-        Layout(create_dependencies_table(metrics), name="dependencies")
-    )
+    layout = _get_report_layout()
+    layout["languages"].update(create_language_distribution_table(metrics))
+    layout["complexity"].update(create_complexity_table(metrics))
+    layout["hotspots"].update(create_hotspots_table(metrics))
+    layout["dependencies"].update(create_dependencies_table(metrics))
 
     console.print(layout)
 
 @debug
 def display_initial_info(project_path: Path, exclude: List[str], include_tests: bool) -> None:
     """Display initial information about the analysis."""
-    logger.info(f"Starting analysis of project: {project_path}")
-    logger.info(f"Exclusions: {', '.join(exclude) if exclude else 'None'}")
-    logger.info(f"Including tests: {include_tests}")
+    logger.info("Starting analysis of project: %s", project_path)
+    logger.info("Exclusions: %s", ', '.join(exclude) if exclude else 'None')
+    logger.info("Including tests: %s", include_tests)
     
-    console.print(Panel.fit(
+    # Collect every part so the whole header is rendered and written in one print
+    renderables: List[Any] = [Panel.fit(
         f"🔍 [bold blue]Advanced Codebase Analysis[/bold blue]\n"
         f"📁 Project: [cyan]{project_path.name}[/cyan]\n"
         f"📂 Path: [dim]{project_path}[/dim]",
         border_style="blue"
-    ))
+    )]
 
     if exclude:
-        console.print(f"[yellow]📁 Excluding directories:[/yellow] {', '.join(exclude)}")
+        renderables.append(f"[yellow]📁 Excluding directories:[/yellow] {', '.join(exclude)}")
 
     if include_tests:
-        console.print("[yellow]🧪 Including test directories[/yellow]")
+        renderables.append("[yellow]🧪 Including test directories[/yellow]")
+
+    console.print(Group(*renderables))
 
 @debug
 def display_final_summary(metrics: ProjectMetrics) -> None:
     """Display the final analysis summary."""
     logger.info("Analysis complete")
-    logger.info(f"Code Quality Score: {metrics.code_quality_score:.1f}/100")
-    logger.info(f"Maintainability Score: {metrics.maintainability_score:.1f}/100")
-    logger.info(f"Analysis Duration: {metrics.analysis_duration:.2f}s")
-    logger.info(f"Log file saved to: {LOG_FILENAME}")
+    logger.info("Code Quality Score: %.1f/100", metrics.code_quality_score)
+    logger.info("Maintainability Score: %.1f/100", metrics.maintainability_score)
+    logger.info("Analysis Duration: %.2fs", metrics.analysis_duration)
+    logger.info("Log file saved to: %s", LOG_FILENAME)
     
-    console.rule("[bold green]🎉 Analysis Complete")
+    rule = Rule("[bold green]🎉 Analysis Complete")
 
     quality_emoji = "🟢" if metrics.code_quality_score >= 80 else "🟡" if metrics.code_quality_score >= 60 else "🔴"
     maintainability_emoji = "🟢" if metrics.maintainability_score >= 80 else "🟡" if metrics.maintainability_score >= 60 else "🔴"
 
-    console.print(f"""
+    console.print(Group(rule, f"""
 [bold]📈 Final Assessment:[/bold]
 {quality_emoji} Code Quality: {metrics.code_quality_score:.1f}/100
 {maintainability_emoji} Maintainability: {metrics.maintainability_score:.1f}/100
 ⏱️  Analysis completed in {metrics.analysis_duration:.2f} seconds
 🎯 Focus on the {len(metrics.most_complex_files)} most complex files for maximum impact
 📝 Log file: {LOG_FILENAME}
-""")
+"""))
 
 @debug
 def display_verbose_info(metrics: ProjectMetrics) -> None:
     """Display additional verbose information."""
     logger.info("Displaying verbose analysis information")
-    console.rule("[bold blue]📊 Detailed Analysis")
+    rule = Rule("[bold blue]📊 Detailed Analysis")
 
     # File size distribution
     size_table = Table(title="📏 File Size Distribution", box=box.ROUNDED)
     size_table.add_column("Size Range", style="cyan")
     size_table.add_column("Files", justify="right", style="magenta")
 
-    size_ranges = [(0, 100), (100, 500), (500, 1000), (1000, 5000), (5000, float('inf'))]
+    size_bins = [0, 100, 500, 1000, 5000, np.iinfo(np.int64).max]
     size_labels = ["< 100 lines", "100-500 lines", "500-1K lines", "1K-5K lines", "> 5K lines"]
 
-    for (min_size, max_size), label in zip(size_ranges, size_labels):
-        count = sum(1 for f in metrics.file_metrics
-                    if min_size <= f.sloc < max_size)
+    # Bucket every file in one pass instead of scanning all files once per range
+    slocs = np.fromiter((f.sloc for f in metrics.file_metrics), dtype=np.int64, count=len(metrics.file_metrics))
+    counts, _ = np.histogram(slocs, bins=size_bins)
+    for label, count in zip(size_labels, counts):
         size_table.add_row(label, str(count))
 
-    console.print(size_table)
-    console.print()
+    console.print(Group(rule, size_table, ""))
 
     display_security_issues(metrics)
 
@@ -505,22 +589,24 @@ def display_security_issues(metrics: ProjectMetrics) -> None:
     """Display security issues if any exist."""
     from collections import Counter
 
-    security_issues = sum(len(f.security_issues) for f in metrics.file_metrics)
-    logger.info(f"Found {security_issues} security issues")
+    # Total and per-type counts in a single pass over the files
+    security_issues = 0
+    security_counts = Counter()
+    for file_metrics in metrics.file_metrics:
+        issues = file_metrics.security_issues
+        if not issues:
+            continue
+        security_issues += len(issues)
+        security_counts.update(issue.type for issue in issues)
 
-    if any(f.security_issues for f in metrics.file_metrics):
+    logger.info("Found %d security issues", security_issues)
+
+    if security_counts:
         security_table = Table(title="🔒 Security Issues", box=box.ROUNDED)
         security_table.add_column("Issue Type", style="red")
         security_table.add_column("Files Affected", justify="right", style="magenta")
 
-        security_counts = Counter()
-        for file_metrics in metrics.file_metrics:
-            for issue in file_metrics.security_issues:
-                issue_type = issue.get('type', 'unknown')
-                security_counts[issue_type] += 1
-
         for issue_type, count in security_counts.most_common():
             security_table.add_row(issue_type.replace('_', ' ').title(), str(count))
 
-        console.print(security_table)
-        console.print()
+        console.print(Group(security_table, ""))
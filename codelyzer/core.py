@@ -336,25 +336,23 @@ class AdvancedCodeAnalyzer:
         
         # Track top complex files
         if metrics.complexity_score > 0:
-            self._add_complex_file(project_metrics, metrics.file_path)
+            self._add_complex_file(project_metrics, metrics)
         
         debug_log(f"Updated project metrics with file: {metrics.file_path}")
     
-    def _add_complex_file(self, project_metrics: ProjectMetrics, file_path: str) -> None:
+    def _add_complex_file(self, project_metrics: ProjectMetrics, file_metrics: FileMetrics) -> None:
         """Add a file to the most complex files list, sort and keep only top 100"""
+        complexity = project_metrics.complexity
+        most_complex = complexity.most_complex_file_metrics
         # Add file to the list if not already present
-        if file_path not in project_metrics.most_complex_files:
-            project_metrics.complexity.most_complex_files.append(file_path)
+        if file_metrics.file_path not in complexity.most_complex_files:
+            most_complex = most_complex + [file_metrics]
         
         # Sort the list by complexity
-        project_metrics.complexity.most_complex_files.sort(
-            key=lambda f: next((fm.complexity_score for fm in project_metrics.file_metrics if fm.file_path == f), 0),
-            reverse=True
-        )
+        most_complex = sorted(most_complex, key=lambda fm: fm.complexity_score, reverse=True)
         
         # Trim the list to the top 100 files
-        if len(project_metrics.complexity.most_complex_files) > 100:
-            project_metrics.complexity.most_complex_files = project_metrics.complexity.most_complex_files[:100]
+        complexity.set_most_complex(most_complex[:100])
 
     @staticmethod
     def _show_progress_stats(current: int, total: int, start_time: float, language_stats: Dict) -> None:
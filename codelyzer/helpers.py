@@ -122,7 +122,7 @@ class ProjectMetricsProcessor:
         # Sort by complexity
         metrics.file_metrics.sort(key=lambda x: x.complexity_score, reverse=True)
         # Update most complex files - use nested attribute instead of top-level property
-        metrics.complexity.most_complex_files = [file.file_path for file in metrics.file_metrics[:10]]
+        metrics.complexity.set_most_complex(metrics.file_metrics[:10])
 
         # Sort by size
         sorted_by_size = sorted(metrics.file_metrics, key=lambda x: x.sloc, reverse=True)
@@ -153,6 +153,7 @@ class Scoring:
         # Update language statistics
         lang = file_metrics.language
         project_metrics.base.languages[lang] = project_metrics.base.languages.get(lang, 0) + 1
+        project_metrics.base.total_files_by_language += 1
 
         # Update structure metrics
         project_metrics.structure.total_classes += file_metrics.classes or 0
@@ -172,6 +173,7 @@ class Scoring:
             level = Scoring.determine_complexity_level(file_metrics.complexity_score)
             metrics.complexity.complexity_distribution[level] = metrics.complexity.complexity_distribution.get(level,
                                                                                                                0) + 1
+            metrics.complexity.total_files_by_complexity += 1
 
     @staticmethod
     def determine_complexity_level(score: float) -> ComplexityLevel:
@@ -239,7 +241,7 @@ class Scoring:
         sorted_by_complexity = sorted(metrics.file_metrics, key=lambda f: f.complexity_score, reverse=True)
 
         # Get most complex files
-        metrics.complexity.most_complex_files = [f.file_path for f in sorted_by_complexity[:10]]
+        metrics.complexity.set_most_complex(sorted_by_complexity[:10])
 
         # Get largest files
         sorted_by_size = sorted(metrics.file_metrics, key=lambda f: f.file_size, reverse=True)
@@ -258,7 +260,7 @@ class Scoring:
         """Calculate security summary statistics"""
         for file_metrics in metrics.file_metrics:
             for issue in file_metrics.security_issues:
-                level = issue.get('level', SecurityLevel.MEDIUM_RISK)
+                level = issue.level
                 metrics.security.security_summary[level] = metrics.security.security_summary.get(level, 0) + 1
 
                 # Track critical vulnerabilities
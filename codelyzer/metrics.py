@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import StrEnum, auto
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, NamedTuple, Optional
 
 
 class MetricLevel(StrEnum):
@@ -99,10 +99,27 @@ class ComplexityMetrics(FileMetricCategory):
             return ComplexityLevel.EXTREME
 
 
+class Location(NamedTuple):
+    """Position of a finding in a file"""
+    line: int
+    column: int
+    position: int
+
+
+@dataclass(slots=True)
+class Vulnerability:
+    """A security issue found in a file"""
+    type: str
+    message: str
+    location: Location
+    level: SecurityLevel
+    severity: str
+
+
 @dataclass
 class SecurityMetrics(FileMetricCategory):
     """Security-related metrics"""
-    vulnerabilities: List[Dict] = field(default_factory=list)
+    vulnerabilities: List[Vulnerability] = field(default_factory=list)
     security_score: float = 100.0
 
     def determine_security_level(self) -> SecurityLevel:
@@ -110,8 +127,8 @@ class SecurityMetrics(FileMetricCategory):
         if not self.vulnerabilities:
             return SecurityLevel.SECURE
 
-        critical_count = sum(1 for v in self.vulnerabilities if v.get('severity') == 'critical')
-        high_count = sum(1 for v in self.vulnerabilities if v.get('severity') == 'high')
+        critical_count = sum(1 for v in self.vulnerabilities if v.severity == 'critical')
+        high_count = sum(1 for v in self.vulnerabilities if v.severity == 'high')
 
         if critical_count > 0:
             return SecurityLevel.CRITICAL
@@ -227,7 +244,7 @@ class FileMetrics:
         return self.code_smells.duplicated_lines
 
     @property
-    def security_issues(self) -> List[Dict]:
+    def security_issues(self) -> List[Vulnerability]:
         return self.security.vulnerabilities
 
     @property
@@ -272,6 +289,7 @@ class BaseProjectMetrics:
     total_comments: int = 0
     total_blanks: int = 0
     languages: Dict[str, int] = field(default_factory=dict)
+    total_files_by_language: int = 0  # Sum of the language counts
     project_size: int = 0  # Size in bytes
     analysis_duration: float = 0.0
 
@@ -290,11 +308,18 @@ class ProjectStructureMetrics:
 class ProjectComplexityMetrics:
     """Project complexity metrics"""
     complexity_distribution: Dict[ComplexityLevel, int] = field(default_factory=dict)
+    total_files_by_complexity: int = 0  # Sum of the complexity distribution counts
     most_complex_files: List[str] = field(default_factory=list)
+    most_complex_file_metrics: List[FileMetrics] = field(default_factory=list)
     avg_cyclomatic_complexity: float = 0.0
     avg_maintainability_index: float = 0.0
     maintainability_score: float = 0.0
 
+    def set_most_complex(self, file_metrics: List[FileMetrics]) -> None:
+        """Set the most complex files, keeping the path list in step with their metrics"""
+        self.most_complex_file_metrics = file_metrics
+        self.most_complex_files = [fm.file_path for fm in file_metrics]
+
 
 @dataclass
 class ProjectSecurityMetrics:
@@ -378,14 +403,22 @@ class ProjectMetrics:
     def complexity_distribution(self) -> Dict[ComplexityLevel, int]:
         return self.complexity.complexity_distribution
 
+    @property
+    def total_files_by_language(self) -> int:
+        return self.base.total_files_by_language
+
+    @property
+    def total_files_by_complexity(self) -> int:
+        return self.complexity.total_files_by_complexity
+
     @property
     def most_complex_files(self) -> List[str]:
         return self.complexity.most_complex_files
 
-    @most_complex_files.setter
-    def most_complex_files(self, value: List[str]) -> None:
-        """Set the most complex files list"""
-        self.complexity.most_complex_files = value
+    @property
+    def most_complex_file_metrics(self) -> List[FileMetrics]:
+        """Metrics of the most complex files, in the same order as most_complex_files"""
+        return self.complexity.most_complex_file_metrics
 
     @property
     def code_quality_score(self) -> float:
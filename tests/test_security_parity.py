@@ -0,0 +1,94 @@
+"""
+Parity tests between the fused security scanners and running every rule pattern on its own.
+Rules of the same vulnerability type share one alternation, so a duplicate hit of that type on
+the same text is reported once; findings of different types must never hide each other.
+"""
+import re
+from typing import List, Sequence, Set, Tuple
+
+import pytest
+
+from codelyzer.analyzers import _scan_engine
+from codelyzer.analyzers._scan_engine import AHOCORASICK_AVAILABLE, RuleScanner
+from codelyzer.analyzers.security import (
+    SecurityAnalyzer, _JS_FAMILIES, _PY_FAMILIES, _RuleFamily
+)
+from codelyzer.metrics import FileMetrics, create_file_metrics
+
+PY_SAMPLES = [
+    'os.system("mysql --password=\'hunter2\' db")\n',
+    'subprocess.call(cmd + " --token=\'abc123\'")\n',
+    'cursor.execute("SELECT * FROM t WHERE id=" + uid)\n',
+    'db.execute(f"SELECT {column} FROM users WHERE password = \'{pw}\'")\n',
+    'data = pickle.loads(blob)\nyaml.load(stream)\nmarshal.loads(b)\n',
+    'import os\nAPI_KEY = "abc"\npassword = os.environ["PW"]\nsecret = \'s3\'\n',
+    'eval(expr)\nos.system("ls")\nos.system(user_cmd)\n',
+    'x = 1\n\nos.system(f"curl -H \'token=\\"t0k\\"\' {url}")\nsubprocess.Popen(args)\n',
+]
+
+JS_SAMPLES = [
+    'document.write("<a token=\'abc123\'>")\n',
+    'el.innerHTML = "<b password=\'hunter2\'>";\n',
+    'eval(code);\nconst apiKey = "k";\nconst token = process.env.TOKEN;\n',
+    'document.write(eval("1 + 1"));\n',
+    'let a;\nel.innerHTML = eval(userInput);\ndocument.write(x)\n',
+]
+
+
+def _per_pattern_findings(content: str, families: Sequence[_RuleFamily]) -> Set[Tuple[str, int]]:
+    """Run each rule pattern separately, as the analyzer did before the rules were fused"""
+    findings = set()
+    for family in families:
+        for rule in family.rules_by_group.values():
+            for match in re.finditer(rule.pattern, content, re.IGNORECASE if rule.ignore_case else 0):
+                if any(marker in match.group(0) for marker in rule.exclude):
+                    continue
+                findings.add((rule.vuln_type, content.count("\n", 0, match.start()) + 1))
+    return findings
+
+
+def _analyze(content: str, language: str) -> FileMetrics:
+    file_metrics = create_file_metrics("sample.py" if language == "python" else "sample.js", language)
+    SecurityAnalyzer().analyze_file(file_metrics, content, None)
+    return file_metrics
+
+
+def _findings(file_metrics: FileMetrics) -> List[Tuple[str, int]]:
+    return [(issue.type, issue.location.line) for issue in file_metrics.security_issues]
+
+
+@pytest.mark.parametrize("content", PY_SAMPLES)
+def test_python_findings_match_per_pattern_scan(content: str) -> None:
+    assert set(_findings(_analyze(content, "python"))) == _per_pattern_findings(content, _PY_FAMILIES)
+
+
+@pytest.mark.parametrize("content", JS_SAMPLES)
+@pytest.mark.parametrize("language", ["javascript", "typescript", "jsx"])
+def test_js_findings_match_per_pattern_scan(content: str, language: str) -> None:
+    assert set(_findings(_analyze(content, language))) == _per_pattern_findings(content, _JS_FAMILIES)
+
+
+def test_secret_inside_command_is_reported() -> None:
+    file_metrics = _analyze('os.system("mysql --password=\'hunter2\' db")\n', "python")
+    assert _findings(file_metrics) == [("os_command_injection", 1), ("hardcoded_secret", 1)]
+    assert file_metrics.security.security_score == 70.0
+
+
+def test_secret_inside_document_write_is_reported() -> None:
+    file_metrics = _analyze('document.write("<a token=\'abc123\'>")\n', "javascript")
+    assert _findings(file_metrics) == [("document_write", 1), ("hardcoded_secret", 1)]
+    assert file_metrics.security.security_score == 80.0
+
+
+@pytest.mark.parametrize("language", ["python", "javascript"])
+def test_long_secret_is_reported(language: str) -> None:
+    content = 'API_TOKEN = "eyJhbGciOiJIUzI1NiJ9.' + "x" * 300 + '"\n'
+    assert _findings(_analyze(content, language)) == [("hardcoded_secret", 1)]
+
+
+@pytest.mark.skipif(not AHOCORASICK_AVAILABLE, reason="pyahocorasick is not installed")
+def test_aho_corasick_prefilter_keeps_case_sensitive_anchors(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(_scan_engine, "HYPERSCAN_AVAILABLE", False)
+    scanner = RuleScanner([("popen", r"subprocess\.Popen\([^)]{0,512}\)", False)])
+    assert [m.span() for m in scanner.finditer("subprocess.Popen(args)")] == [(0, 22)]
+    assert scanner._automaton is not None
@@ -0,0 +1,71 @@
+"""
+ReDoS regression tests for the security rules.
+Long single-line inputs without the closing delimiter used to make the unbounded patterns backtrack
+quadratically; with bounded repetitions each scan has to stay well under a second.
+"""
+import time
+
+import pytest
+
+from codelyzer.analyzers._scan_engine import RuleScanner, unbounded
+from codelyzer.analyzers.security import _JS_FAMILIES, _PY_FAMILIES
+
+LINE_LENGTH = 10 * 1024
+MAX_SECONDS = 1.0
+
+# One fused scanner per vulnerability type
+SCANNERS = {
+    next(iter(family.rules_by_group.values())).vuln_type: family.scanner
+    for family in _PY_FAMILIES + _JS_FAMILIES
+}
+
+
+def _line(unit: str) -> str:
+    """Repeat the unit into a single 10 KB line"""
+    return (unit * (LINE_LENGTH // len(unit) + 1))[:LINE_LENGTH]
+
+
+PATHOLOGICAL_LINES = {
+    "execute_plus": "execute(" + _line("+"),
+    "execute_percent": "execute(" + _line("%"),
+    "execute_repeated": _line("execute(+"),
+    "execute_fstring": _line("execute(f'{"),
+    "os_system": "os.system(" + _line("x"),
+    "yaml_load": _line("yaml.load("),
+    "password": "password = '" + _line("x"),
+    "innerhtml": ".innerHTML = " + _line("x"),
+    "document_write": _line("document.write("),
+    "eval": _line("eval("),
+}
+
+
+@pytest.mark.parametrize("scanner", SCANNERS.values(), ids=SCANNERS.keys())
+@pytest.mark.parametrize("line", PATHOLOGICAL_LINES.values(), ids=PATHOLOGICAL_LINES.keys())
+def test_fused_patterns_scan_long_lines_quickly(scanner: RuleScanner, line: str) -> None:
+    # Time the re patterns themselves, since a prefilter could skip the line entirely
+    for pattern, data in ((scanner.pattern, line), (scanner.bytes_pattern, line.encode("ascii"))):
+        start = time.perf_counter()
+        for _ in pattern.finditer(data):
+            pass
+        assert time.perf_counter() - start < MAX_SECONDS
+
+
+@pytest.mark.parametrize("scanner", SCANNERS.values(), ids=SCANNERS.keys())
+@pytest.mark.parametrize("line", PATHOLOGICAL_LINES.values(), ids=PATHOLOGICAL_LINES.keys())
+def test_scanner_matches_re_on_long_lines(scanner: RuleScanner, line: str) -> None:
+    expected = [(m.lastgroup, m.span()) for m in scanner.bytes_pattern.finditer(line.encode("ascii"))]
+    assert [(m.lastgroup, m.span()) for m in scanner.finditer(line)] == expected
+
+
+def test_prefilters_are_built_on_first_scan() -> None:
+    scanner = RuleScanner([("rule", r"execute\([^)]{0,512}\)", False)])
+    assert not scanner._prefilters_built
+
+    assert [m.span() for m in scanner.finditer("cursor.execute(query)")] == [(7, 21)]
+    assert scanner._prefilters_built
+
+
+def test_unbounded_drops_upper_bounds_only() -> None:
+    assert unbounded(r"execute\([^,]{0,512}\+[^)]{1,256}\)") == r"execute\([^,]{0,}\+[^)]{1,}\)"
+    assert unbounded(r"f['\"]{[^}\n]{0,256}}") == r"f['\"]{[^}\n]{0,}}"
+    assert unbounded(r"\d{4}") == r"\d{4}"